@@ -1,10 +1,86 @@
 """Configuration module for Generac AWS Notifier."""
+import functools
 import os
+import time
 from dataclasses import dataclass
-from typing import Optional
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
 
+# Seconds a fetched secret is reused before Secrets Manager is queried again.
+# Well above the default 5 minute schedule, so warm runs actually reuse it; a
+# rejected cookie is dropped early through clear_cached_secret.
+SECRET_CACHE_TTL = 1800
 
-@dataclass
+# Secret values cached across warm invocations: name -> (value, fetched_at)
+_SECRET_CACHE: dict[str, tuple[str, float]] = {}
+
+
+def _fetch_secret(secret_name: str, ttl: float = SECRET_CACHE_TTL) -> str:
+    """Fetch a secret string from Secrets Manager, reusing a cached value.
+
+    Args:
+        secret_name: Name of the Secrets Manager secret
+        ttl: Maximum age in seconds of a cached value
+
+    Returns:
+        The secret string
+    """
+    cached = _SECRET_CACHE.get(secret_name)
+    if cached is not None and time.monotonic() - cached[1] < ttl:
+        return cached[0]
+
+    import boto3
+
+    secrets_client = boto3.client("secretsmanager")
+    secret_value = secrets_client.get_secret_value(SecretId=secret_name)["SecretString"]
+    _SECRET_CACHE[secret_name] = (secret_value, time.monotonic())
+    return secret_value
+
+
+def clear_cached_secret(secret_name: str) -> None:
+    """Drop a cached secret so the next lookup fetches it again.
+
+    Args:
+        secret_name: Name of the Secrets Manager secret
+    """
+    _SECRET_CACHE.pop(secret_name, None)
+
+
+@functools.lru_cache(maxsize=1)
+def _settings_from_env() -> Mapping[str, Any]:
+    """Parse the settings other than the session cookie from the environment.
+
+    Environment variables are fixed for the lifetime of a Lambda container,
+    so this is only parsed once per container. The result is shared by every
+    Config built in the container, so it is read-only.
+
+    Returns:
+        Keyword arguments for the corresponding Config fields
+    """
+    dynamodb_table = os.environ.get("DYNAMODB_TABLE")
+    if not dynamodb_table:
+        raise ValueError("DYNAMODB_TABLE environment variable is required")
+
+    ses_to_emails_str = os.environ.get("SES_TO_EMAILS")
+    ses_to_emails = None
+    if ses_to_emails_str:
+        ses_to_emails = tuple(email.strip() for email in ses_to_emails_str.split(","))
+
+    return MappingProxyType({
+        "dynamodb_table": dynamodb_table,
+        "sns_topic_arn": os.environ.get("SNS_TOPIC_ARN"),
+        "ses_from_email": os.environ.get("SES_FROM_EMAIL"),
+        "ses_to_emails": ses_to_emails,
+        "notify_on_status_change": os.environ.get("NOTIFY_ON_STATUS_CHANGE", "true").lower() == "true",
+        "notify_on_connectivity_change": os.environ.get("NOTIFY_ON_CONNECTIVITY_CHANGE", "true").lower() == "true",
+        "notify_on_maintenance_alert": os.environ.get("NOTIFY_ON_MAINTENANCE_ALERT", "true").lower() == "true",
+        "notify_on_warning": os.environ.get("NOTIFY_ON_WARNING", "true").lower() == "true",
+        "notify_on_low_battery": os.environ.get("NOTIFY_ON_LOW_BATTERY", "true").lower() == "true",
+        "low_battery_threshold": float(os.environ.get("LOW_BATTERY_THRESHOLD", "12.0")),
+    })
+
+
+@dataclass(slots=True)
 class Config:
     """Application configuration."""
 
@@ -16,7 +92,7 @@ class Config:
     secret_name: Optional[str] = None
     sns_topic_arn: Optional[str] = None
     ses_from_email: Optional[str] = None
-    ses_to_emails: Optional[list[str]] = None
+    ses_to_emails: Optional[tuple[str, ...]] = None
 
     # Notification settings
     notify_on_status_change: bool = True
@@ -46,47 +122,24 @@ class Config:
             NOTIFY_ON_LOW_BATTERY: Enable low battery notifications (default: true)
             LOW_BATTERY_THRESHOLD: Battery voltage threshold (default: 12.0)
         """
-        import boto3
-        import json as json_lib
-
         # Get session cookie from Secrets Manager or environment
         secret_name = os.environ.get("SECRET_NAME")
         session_cookie = os.environ.get("GENERAC_SESSION_COOKIE")
 
         if secret_name:
-            # Fetch from Secrets Manager
+            # Fetch from Secrets Manager (cached across warm invocations)
             try:
-                secrets_client = boto3.client("secretsmanager")
-                secret_value = secrets_client.get_secret_value(SecretId=secret_name)
-                session_cookie = secret_value["SecretString"]
+                session_cookie = _fetch_secret(secret_name)
             except Exception as e:
                 raise ValueError(f"Failed to retrieve secret from Secrets Manager: {e}")
 
         if not session_cookie:
             raise ValueError("Either SECRET_NAME or GENERAC_SESSION_COOKIE environment variable is required")
 
-        dynamodb_table = os.environ.get("DYNAMODB_TABLE")
-        if not dynamodb_table:
-            raise ValueError("DYNAMODB_TABLE environment variable is required")
-
-        ses_to_emails_str = os.environ.get("SES_TO_EMAILS")
-        ses_to_emails = None
-        if ses_to_emails_str:
-            ses_to_emails = [email.strip() for email in ses_to_emails_str.split(",")]
-
         return cls(
             session_cookie=session_cookie,
             secret_name=secret_name,
-            dynamodb_table=dynamodb_table,
-            sns_topic_arn=os.environ.get("SNS_TOPIC_ARN"),
-            ses_from_email=os.environ.get("SES_FROM_EMAIL"),
-            ses_to_emails=ses_to_emails,
-            notify_on_status_change=os.environ.get("NOTIFY_ON_STATUS_CHANGE", "true").lower() == "true",
-            notify_on_connectivity_change=os.environ.get("NOTIFY_ON_CONNECTIVITY_CHANGE", "true").lower() == "true",
-            notify_on_maintenance_alert=os.environ.get("NOTIFY_ON_MAINTENANCE_ALERT", "true").lower() == "true",
-            notify_on_warning=os.environ.get("NOTIFY_ON_WARNING", "true").lower() == "true",
-            notify_on_low_battery=os.environ.get("NOTIFY_ON_LOW_BATTERY", "true").lower() == "true",
-            low_battery_threshold=float(os.environ.get("LOW_BATTERY_THRESHOLD", "12.0")),
+            **_settings_from_env(),
         )
 
 
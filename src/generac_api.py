@@ -1,20 +1,25 @@
 """Generac API Client for AWS Lambda."""
-import json
+import asyncio
 import logging
 from typing import Optional
 
 import aiohttp
-from dacite import from_dict
+import orjson
+from dacite import Config as DaciteConfig, from_dict
 
+from config import DEVICE_TYPE_GENERATOR, DEVICE_TYPE_PROPANE_MONITOR
 from models import Apparatus, ApparatusDetail, Item
 
 API_BASE = "https://app.mobilelinkgen.com/api"
 TIMEOUT = 10
+MAX_CONCURRENT_REQUESTS = 10
+
+# Shared dacite config; API payloads are trusted to match the models, so the
+# per-field type validation walk is skipped when building them.
+_DACITE_CONFIG = DaciteConfig(check_types=False)
 
 # Device types
-DEVICE_TYPE_GENERATOR = 0
-DEVICE_TYPE_PROPANE_MONITOR = 2
-ALLOWED_DEVICES = [DEVICE_TYPE_GENERATOR, DEVICE_TYPE_PROPANE_MONITOR]
+ALLOWED_DEVICES = frozenset({DEVICE_TYPE_GENERATOR, DEVICE_TYPE_PROPANE_MONITOR})
 
 logger = logging.getLogger(__name__)
 
@@ -47,6 +52,7 @@ class GeneracApiClient:
             "Accept-Language": "en-US,en;q=0.9",
             "Accept-Encoding": "gzip, deflate, br",
             "Connection": "keep-alive",
+            "Cookie": session_cookie,
         }
 
     async def __aenter__(self):
@@ -83,31 +89,49 @@ class GeneracApiClient:
             logger.error("Expected list from /v2/Apparatus/list got %s", type(apparatuses))
             return {}
 
-        data: dict[str, Item] = {}
+        filtered = []
         for apparatus_data in apparatuses:
-            apparatus = from_dict(Apparatus, apparatus_data)
+            apparatus = from_dict(Apparatus, apparatus_data, config=_DACITE_CONFIG)
             if apparatus.type not in ALLOWED_DEVICES:
                 logger.debug(
                     "Unknown apparatus type %s %s", apparatus.type, apparatus.name
                 )
                 continue
-
-            # Get detailed information for this apparatus
-            detail_json = await self._get_endpoint(
-                f"/v1/Apparatus/details/{apparatus.apparatusId}"
+            filtered.append(apparatus)
+
+        # Get detailed information for all apparatuses concurrently
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        tasks = [
+            asyncio.create_task(
+                self._get_endpoint_limited(
+                    semaphore, f"/v1/Apparatus/details/{apparatus.apparatusId}"
+                )
             )
-            if detail_json is None:
+            for apparatus in filtered
+        ]
+        details = await asyncio.gather(*tasks, return_exceptions=True)
+
+        data: dict[str, Item] = {}
+        for apparatus, detail_json in zip(filtered, details):
+            if isinstance(detail_json, SessionExpiredException):
+                raise detail_json
+            if isinstance(detail_json, Exception) or detail_json is None:
                 logger.debug(
                     "Could not decode response from /v1/Apparatus/details/%s",
                     apparatus.apparatusId
                 )
                 continue
 
-            detail = from_dict(ApparatusDetail, detail_json)
+            detail = from_dict(ApparatusDetail, detail_json, config=_DACITE_CONFIG)
             data[str(apparatus.apparatusId)] = Item(apparatus, detail)
 
         return data
 
+    async def _get_endpoint_limited(self, semaphore: asyncio.Semaphore, endpoint: str):
+        """Make a GET request, waiting for a free slot on the semaphore first."""
+        async with semaphore:
+            return await self._get_endpoint(endpoint)
+
     async def _get_endpoint(self, endpoint: str):
         """Make a GET request to the Generac API.
 
@@ -124,10 +148,10 @@ class GeneracApiClient:
             raise RuntimeError("Session not initialized. Use 'async with' context manager.")
 
         try:
-            headers = {**self._headers, "Cookie": self._session_cookie}
-
             url = API_BASE + endpoint
-            async with self._session.get(url, headers=headers, timeout=TIMEOUT) as response:
+            async with self._session.get(
+                url, headers=self._headers, timeout=TIMEOUT
+            ) as response:
                 if response.status == 204:
                     # No data
                     return None
@@ -137,8 +161,14 @@ class GeneracApiClient:
                         f"API returned status code: {response.status}"
                     )
 
-                data = await response.json()
-                logger.debug("GET %s: %s", endpoint, json.dumps(data))
+                body = await response.read()
+                if not body.strip():
+                    # Empty body, which aiohttp's response.json() maps to None
+                    return None
+
+                data = orjson.loads(body)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("GET %s: %s", endpoint, orjson.dumps(data).decode())
                 return data
 
         except SessionExpiredException:
@@ -4,9 +4,9 @@ import logging
 import sys
 from typing import Any
 
-from config import Config
-from generac_api import GeneracApiClient
-from notifier import Notifier
+from config import Config, clear_cached_secret
+from generac_api import GeneracApiClient, SessionExpiredException
+from notifier import Notifier, format_timestamp
 from state_manager import StateManager
 
 # Configure logging
@@ -42,58 +42,96 @@ async def check_generators(config: Config) -> dict[str, Any]:
         "errors": [],
     }
 
+    # A single timestamp for every notification sent during this run
+    run_ts = format_timestamp()
+
     try:
         # Fetch current device data from Generac API
+        logger.info("Fetching device data from Generac API")
         async with GeneracApiClient(config.session_cookie) as api_client:
-            logger.info("Fetching device data from Generac API")
             devices = await api_client.get_device_data()
-            logger.info("Found %d devices", len(devices))
-            results["devices_checked"] = len(devices)
-
-            # Process each device
-            for device_id, item in devices.items():
-                try:
-                    logger.info("Processing device %s: %s", device_id, item.apparatus.name)
-
-                    # Extract current state
-                    current_state = state_manager.extract_state(item)
-
-                    # Get previous state from DynamoDB
-                    previous_state = state_manager.get_previous_state(device_id)
-
-                    # Compare states
-                    comparison = state_manager.compare_states(previous_state, current_state)
-
-                    # Log changes
-                    if comparison["is_new_device"]:
-                        logger.info("New device detected: %s", device_id)
-                    elif comparison["changes"]:
-                        logger.info(
-                            "Device %s has %d changes: %s",
-                            device_id,
-                            len(comparison["changes"]),
-                            list(comparison["changes"].keys()),
-                        )
-                    else:
-                        logger.debug("No changes for device %s", device_id)
-
-                    # Send notifications if needed
-                    if comparison["is_new_device"] or comparison["changes"]:
-                        await notifier.process_changes(
-                            device_id,
-                            current_state,
-                            comparison["changes"],
-                            comparison["is_new_device"],
-                        )
-                        results["notifications_sent"] += 1
-
-                    # Save current state
-                    state_manager.save_state(device_id, current_state)
-
-                except Exception as e:
-                    error_msg = f"Error processing device {device_id}: {str(e)}"
-                    logger.error(error_msg, exc_info=True)
-                    results["errors"].append(error_msg)
+        logger.info("Found %d devices", len(devices))
+        results["devices_checked"] = len(devices)
+
+        # Get previous states from DynamoDB in one batch
+        previous_states = state_manager.batch_get_previous_states(list(devices))
+        states_to_save: dict[str, dict[str, Any]] = {}
+        notifications: dict[str, asyncio.Task] = {}
+
+        # Process each device
+        for device_id, item in devices.items():
+            try:
+                logger.info("Processing device %s: %s", device_id, item.apparatus.name)
+
+                # Extract current state
+                current_state = state_manager.extract_state(item)
+
+                # Compare states
+                comparison = state_manager.compare_states(
+                    previous_states.get(device_id), current_state
+                )
+
+                # Log changes
+                if comparison["is_new_device"]:
+                    logger.info("New device detected: %s", device_id)
+                elif comparison["changes"]:
+                    logger.info(
+                        "Device %s has %d changes: %s",
+                        device_id,
+                        len(comparison["changes"]),
+                        list(comparison["changes"].keys()),
+                    )
+                else:
+                    logger.debug("No changes for device %s", device_id)
+
+                # Unchanged devices need neither a notification nor a write
+                if not (comparison["is_new_device"] or comparison["changes"]):
+                    continue
+
+                # Send notifications if needed, without waiting on other devices
+                notifications[device_id] = asyncio.create_task(
+                    notifier.process_changes(
+                        device_id,
+                        current_state,
+                        comparison["changes"],
+                        comparison["is_new_device"],
+                        run_ts=run_ts,
+                    )
+                )
+
+                # Queue current state for saving
+                states_to_save[device_id] = current_state
+
+            except Exception as e:
+                error_msg = f"Error processing device {device_id}: {str(e)}"
+                logger.error(error_msg, exc_info=True)
+                results["errors"].append(error_msg)
+
+        # Wait for notifications; states of devices that failed to notify are
+        # not saved so the change is picked up again on the next run
+        outcomes = await asyncio.gather(*notifications.values(), return_exceptions=True)
+        notified_states: dict[str, dict[str, Any]] = {}
+        for device_id, outcome in zip(notifications, outcomes):
+            if isinstance(outcome, Exception):
+                error_msg = f"Error processing device {device_id}: {str(outcome)}"
+                logger.error(error_msg, exc_info=outcome)
+                results["errors"].append(error_msg)
+            else:
+                results["notifications_sent"] += 1
+                notified_states[device_id] = states_to_save[device_id]
+
+        # Save current states to DynamoDB in one batch
+        if notified_states:
+            state_manager.save_states(notified_states)
+
+    except SessionExpiredException as e:
+        # The cookie may have been rotated since it was cached; fetch it again
+        # on the next run
+        if config.secret_name:
+            clear_cached_secret(config.secret_name)
+        error_msg = f"Error fetching device data: {str(e)}"
+        logger.error(error_msg)
+        results["errors"].append(error_msg)
 
     except Exception as e:
         error_msg = f"Error fetching device data: {str(e)}"
@@ -114,7 +152,7 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
         Response dictionary with statusCode and body
     """
     logger.info("Starting Generac generator check")
-    logger.info("Event: %s", event)
+    logger.debug("Event: %s", event)
 
     try:
         # Load configuration from environment
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Optional
 
 
@@ -187,6 +188,14 @@ class ApparatusDetail:
     productInfo: Optional[list[Property]] = None
     hasDisconnectedNotificationsOn: Optional[bool] = None
 
+    @cached_property
+    def properties_by_type(self) -> dict[Optional[int | str], Property]:
+        """Properties indexed by type, keeping the first of each type."""
+        by_type: dict[Optional[int | str], ApparatusDetail.Property] = {}
+        for prop in self.properties or ():
+            by_type.setdefault(prop.type, prop)
+        return by_type
+
 
 @dataclass
 class Item:
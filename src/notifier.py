@@ -1,7 +1,9 @@
 """Notification handler for generator status changes."""
+import asyncio
+import functools
 import logging
-from datetime import datetime
-from typing import Any
+from datetime import datetime, timezone
+from typing import Any, Callable, Optional
 
 import boto3
 from botocore.exceptions import ClientError
@@ -11,6 +13,163 @@ from config import Config, GENERATOR_STATUS_MAP, DEVICE_NAME_MAP
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
+def _get_sns():
+    """Return the shared SNS client, created once per Lambda container."""
+    return boto3.client("sns")
+
+
+@functools.lru_cache(maxsize=1)
+def _get_ses():
+    """Return the shared SES client, created once per Lambda container."""
+    return boto3.client("ses")
+
+
+def format_timestamp(moment: Optional[datetime] = None) -> str:
+    """Format a UTC timestamp for notification messages (defaults to now)."""
+    moment = moment or datetime.now(timezone.utc)
+    return moment.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _any_change(change: dict[str, Any]) -> bool:
+    """Gate that passes for any change."""
+    return True
+
+
+def _became_true(change: dict[str, Any]) -> bool:
+    """Gate that passes when a flag changed to True."""
+    return change.get("current") is True
+
+
+def _parse_voltage(battery_voltage: Any) -> Optional[float]:
+    """Parse a battery voltage reading, returning None if missing or invalid."""
+    if not battery_voltage:
+        return None
+    try:
+        return float(battery_voltage)
+    except (ValueError, TypeError):
+        return None
+
+
+@functools.lru_cache(maxsize=256)
+def _format_status_cached(
+    apparatus_status: Optional[int],
+    status_label: Optional[str],
+    is_connected: bool,
+    is_connecting: bool,
+    has_maintenance_alert: bool,
+    show_warning: bool,
+    voltage: Optional[float],
+    low_battery_threshold: float,
+) -> str:
+    """Format a device status into human-readable text.
+
+    Memoized, since most devices report the same status run after run.
+    """
+    status_parts = []
+
+    # Main status
+    if apparatus_status:
+        status_text = GENERATOR_STATUS_MAP.get(apparatus_status, "Unknown")
+        status_parts.append(f"Status: {status_text}")
+    elif status_label:
+        status_parts.append(f"Status: {status_label}")
+
+    # Connection status
+    if is_connected:
+        status_parts.append("Connected: Yes")
+    elif is_connecting:
+        status_parts.append("Connected: Connecting...")
+    else:
+        status_parts.append("Connected: No")
+
+    # Alerts
+    if has_maintenance_alert:
+        status_parts.append("⚠️  Maintenance Alert Active")
+    if show_warning:
+        status_parts.append("⚠️  Warning Active")
+
+    # Battery voltage (for generators)
+    if voltage is not None:
+        status_parts.append(f"Battery: {voltage:.1f}V")
+        if voltage < low_battery_threshold:
+            status_parts.append("🔋 Low Battery Warning")
+
+    return "\n".join(status_parts)
+
+
+_NEW_DEVICE_TMPL = """A new {device_type} has been detected in your Generac account.
+
+Device: {device_name}
+Serial Number: {serial}
+Current Status: {status}
+
+This is the first time this device has been seen by the monitoring system.
+
+Timestamp: {timestamp}"""
+
+_CHANGES_TMPL = """Your {device_type} has reported status changes.
+
+Device: {device_name}
+Serial Number: {serial}
+
+Changes:
+{changes}
+
+Current Status: {status}
+
+Timestamp: {timestamp}"""
+
+
+def _format_status_change(key: str, prev: Any, curr: Any) -> str:
+    """Describe a change of the apparatus status."""
+    prev_text = GENERATOR_STATUS_MAP.get(prev, str(prev))
+    curr_text = GENERATOR_STATUS_MAP.get(curr, str(curr))
+    return f"  • Status changed: {prev_text} → {curr_text}"
+
+
+def _format_connection_change(key: str, prev: Any, curr: Any) -> str:
+    """Describe a change of the connection state."""
+    prev_text = "Connected" if prev else "Disconnected"
+    curr_text = "Connected" if curr else "Disconnected"
+    return f"  • Connection: {prev_text} → {curr_text}"
+
+
+def _format_maintenance_change(key: str, prev: Any, curr: Any) -> str:
+    """Describe a maintenance alert being triggered or cleared."""
+    return "  • ⚠️  Maintenance alert triggered" if curr else "  • ✓ Maintenance alert cleared"
+
+
+def _format_warning_change(key: str, prev: Any, curr: Any) -> str:
+    """Describe a warning being triggered or cleared."""
+    return "  • ⚠️  Warning triggered" if curr else "  • ✓ Warning cleared"
+
+
+def _format_battery_change(key: str, prev: Any, curr: Any) -> str:
+    """Describe a change of the battery voltage."""
+    try:
+        prev_v = float(prev) if prev else 0
+        curr_v = float(curr) if curr else 0
+        return f"  • Battery voltage: {prev_v:.1f}V → {curr_v:.1f}V"
+    except (ValueError, TypeError):
+        return "  • Battery voltage changed"
+
+
+def _format_generic_change(key: str, prev: Any, curr: Any) -> str:
+    """Describe a change of any other state key."""
+    return f"  • {key.replace('_', ' ').title()}: {prev} → {curr}"
+
+
+# Change key -> formatter for its line in the notification body
+_CHANGE_FORMATTERS: dict[str, Callable[[str, Any, Any], str]] = {
+    "apparatus_status": _format_status_change,
+    "is_connected": _format_connection_change,
+    "has_maintenance_alert": _format_maintenance_change,
+    "show_warning": _format_warning_change,
+    "battery_voltage": _format_battery_change,
+}
+
+
 class Notifier:
     """Handles sending notifications via SNS and SES."""
 
@@ -21,42 +180,36 @@ class Notifier:
             config: Application configuration
         """
         self.config = config
-        self.sns = boto3.client("sns") if config.sns_topic_arn else None
-        self.ses = boto3.client("ses") if config.ses_from_email and config.ses_to_emails else None
-
-    def should_notify(
-        self, change_type: str, changes: dict[str, Any], current_state: dict[str, Any]
-    ) -> bool:
-        """Determine if a notification should be sent based on change type.
+        self.sns = _get_sns() if config.sns_topic_arn else None
+        self.ses = _get_ses() if config.ses_from_email and config.ses_to_emails else None
+
+        # Change key -> predicate on the change, for enabled notification types
+        gates = {
+            "apparatus_status": (config.notify_on_status_change, _any_change),
+            "is_connected": (config.notify_on_connectivity_change, _any_change),
+            "is_connecting": (config.notify_on_connectivity_change, _any_change),
+            "has_maintenance_alert": (config.notify_on_maintenance_alert, _became_true),
+            "show_warning": (config.notify_on_warning, _became_true),
+        }
+        self._gate = {key: gate for key, (enabled, gate) in gates.items() if enabled}
+
+    def should_notify(self, changes: dict[str, Any], voltage: Optional[float]) -> bool:
+        """Determine if a notification should be sent for a set of changes.
 
         Args:
-            change_type: Type of change detected
             changes: Dictionary of changes
-            current_state: Current device state
+            voltage: Current battery voltage, or None if not reported
 
         Returns:
             True if notification should be sent
         """
-        if change_type == "status_change" and self.config.notify_on_status_change:
-            return "apparatus_status" in changes
-
-        if change_type == "connectivity" and self.config.notify_on_connectivity_change:
-            return "is_connected" in changes or "is_connecting" in changes
-
-        if change_type == "maintenance" and self.config.notify_on_maintenance_alert:
-            return changes.get("has_maintenance_alert", {}).get("current") is True
-
-        if change_type == "warning" and self.config.notify_on_warning:
-            return changes.get("show_warning", {}).get("current") is True
+        for key, change in changes.items():
+            gate = self._gate.get(key)
+            if gate is not None and gate(change):
+                return True
 
-        if change_type == "low_battery" and self.config.notify_on_low_battery:
-            battery_voltage = current_state.get("battery_voltage")
-            if battery_voltage:
-                try:
-                    voltage = float(battery_voltage)
-                    return voltage < self.config.low_battery_threshold
-                except (ValueError, TypeError):
-                    pass
+        if self.config.notify_on_low_battery and voltage is not None:
+            return voltage < self.config.low_battery_threshold
 
         return False
 
@@ -66,6 +219,8 @@ class Notifier:
         current_state: dict[str, Any],
         changes: dict[str, Any],
         is_new_device: bool,
+        voltage: Optional[float],
+        run_ts: Optional[str] = None,
     ) -> dict[str, str]:
         """Build notification message.
 
@@ -74,6 +229,8 @@ class Notifier:
             current_state: Current device state
             changes: Dictionary of changes
             is_new_device: Whether this is a newly discovered device
+            voltage: Current battery voltage, or None if not reported
+            run_ts: Timestamp of the current run (defaults to now)
 
         Returns:
             Dictionary with 'subject' and 'body' keys
@@ -84,103 +241,44 @@ class Notifier:
 
         if is_new_device:
             subject = f"New {device_type} Detected: {device_name}"
-            body = f"""A new {device_type} has been detected in your Generac account.
-
-Device: {device_name}
-Serial Number: {serial}
-Current Status: {self._format_status(current_state)}
-
-This is the first time this device has been seen by the monitoring system.
-"""
+            template = _NEW_DEVICE_TMPL
+            changes_text = ""
         else:
             subject = f"Generator Alert: {device_name}"
-            body = f"""Your {device_type} has reported status changes.
-
-Device: {device_name}
-Serial Number: {serial}
-
-Changes:
-{self._format_changes(changes, current_state)}
-
-Current Status: {self._format_status(current_state)}
-"""
-
-        body += f"\nTimestamp: {datetime.utcnow().isoformat()}Z"
+            template = _CHANGES_TMPL
+            changes_text = self._format_changes(changes, current_state)
+
+        body = template.format(
+            device_type=device_type,
+            device_name=device_name,
+            serial=serial,
+            changes=changes_text,
+            status=self._format_status(current_state, voltage),
+            timestamp=run_ts or format_timestamp(),
+        )
         return {"subject": subject, "body": body}
 
-    def _format_status(self, state: dict[str, Any]) -> str:
+    def _format_status(self, state: dict[str, Any], voltage: Optional[float]) -> str:
         """Format current status into human-readable text."""
-        status_parts = []
-
-        # Main status
-        apparatus_status = state.get("apparatus_status")
-        if apparatus_status:
-            status_text = GENERATOR_STATUS_MAP.get(apparatus_status, "Unknown")
-            status_parts.append(f"Status: {status_text}")
-        elif state.get("status_label"):
-            status_parts.append(f"Status: {state['status_label']}")
-
-        # Connection status
-        if state.get("is_connected"):
-            status_parts.append("Connected: Yes")
-        elif state.get("is_connecting"):
-            status_parts.append("Connected: Connecting...")
-        else:
-            status_parts.append("Connected: No")
-
-        # Alerts
-        if state.get("has_maintenance_alert"):
-            status_parts.append("⚠️  Maintenance Alert Active")
-        if state.get("show_warning"):
-            status_parts.append("⚠️  Warning Active")
-
-        # Battery voltage (for generators)
-        battery_voltage = state.get("battery_voltage")
-        if battery_voltage:
-            try:
-                voltage = float(battery_voltage)
-                status_parts.append(f"Battery: {voltage:.1f}V")
-                if voltage < self.config.low_battery_threshold:
-                    status_parts.append("🔋 Low Battery Warning")
-            except (ValueError, TypeError):
-                pass
-
-        return "\n".join(status_parts)
+        return _format_status_cached(
+            state.get("apparatus_status"),
+            state.get("status_label"),
+            bool(state.get("is_connected")),
+            bool(state.get("is_connecting")),
+            bool(state.get("has_maintenance_alert")),
+            bool(state.get("show_warning")),
+            voltage,
+            self.config.low_battery_threshold,
+        )
 
     def _format_changes(self, changes: dict[str, Any], current_state: dict[str, Any]) -> str:
         """Format changes into human-readable text."""
-        change_lines = []
-
-        for key, change in changes.items():
-            prev = change.get("previous")
-            curr = change.get("current")
-
-            if key == "apparatus_status":
-                prev_text = GENERATOR_STATUS_MAP.get(prev, str(prev))
-                curr_text = GENERATOR_STATUS_MAP.get(curr, str(curr))
-                change_lines.append(f"  • Status changed: {prev_text} → {curr_text}")
-            elif key == "is_connected":
-                change_lines.append(f"  • Connection: {'Disconnected' if not prev else 'Connected'} → {'Connected' if curr else 'Disconnected'}")
-            elif key == "has_maintenance_alert":
-                if curr:
-                    change_lines.append("  • ⚠️  Maintenance alert triggered")
-                else:
-                    change_lines.append("  • ✓ Maintenance alert cleared")
-            elif key == "show_warning":
-                if curr:
-                    change_lines.append("  • ⚠️  Warning triggered")
-                else:
-                    change_lines.append("  • ✓ Warning cleared")
-            elif key == "battery_voltage":
-                try:
-                    prev_v = float(prev) if prev else 0
-                    curr_v = float(curr) if curr else 0
-                    change_lines.append(f"  • Battery voltage: {prev_v:.1f}V → {curr_v:.1f}V")
-                except (ValueError, TypeError):
-                    change_lines.append(f"  • Battery voltage changed")
-            else:
-                change_lines.append(f"  • {key.replace('_', ' ').title()}: {prev} → {curr}")
-
+        change_lines = [
+            _CHANGE_FORMATTERS.get(key, _format_generic_change)(
+                key, change.get("previous"), change.get("current")
+            )
+            for key, change in changes.items()
+        ]
         return "\n".join(change_lines) if change_lines else "No significant changes"
 
     async def send_notification(self, subject: str, body: str) -> bool:
@@ -193,38 +291,48 @@ Current Status: {self._format_status(current_state)}
         Returns:
             True if at least one notification was sent successfully
         """
-        success = False
-
-        # Send via SNS
-        if self.sns and self.config.sns_topic_arn:
-            try:
-                self.sns.publish(
-                    TopicArn=self.config.sns_topic_arn,
-                    Subject=subject,
-                    Message=body,
-                )
-                logger.info("Sent SNS notification: %s", subject)
-                success = True
-            except ClientError as e:
-                logger.error("Failed to send SNS notification: %s", e)
-
-        # Send via SES
-        if self.ses and self.config.ses_from_email and self.config.ses_to_emails:
-            try:
-                self.ses.send_email(
-                    Source=self.config.ses_from_email,
-                    Destination={"ToAddresses": self.config.ses_to_emails},
-                    Message={
-                        "Subject": {"Data": subject},
-                        "Body": {"Text": {"Data": body}},
-                    },
-                )
-                logger.info("Sent SES notification to %s: %s", self.config.ses_to_emails, subject)
-                success = True
-            except ClientError as e:
-                logger.error("Failed to send SES notification: %s", e)
-
-        return success
+        results = await asyncio.gather(
+            asyncio.to_thread(self._publish_sns, subject, body),
+            asyncio.to_thread(self._publish_ses, subject, body),
+        )
+        return any(results)
+
+    def _publish_sns(self, subject: str, body: str) -> bool:
+        """Publish a notification to the configured SNS topic."""
+        if not (self.sns and self.config.sns_topic_arn):
+            return False
+
+        try:
+            self.sns.publish(
+                TopicArn=self.config.sns_topic_arn,
+                Subject=subject,
+                Message=body,
+            )
+            logger.info("Sent SNS notification: %s", subject)
+            return True
+        except ClientError as e:
+            logger.error("Failed to send SNS notification: %s", e)
+            return False
+
+    def _publish_ses(self, subject: str, body: str) -> bool:
+        """Send a notification email via SES."""
+        if not (self.ses and self.config.ses_from_email and self.config.ses_to_emails):
+            return False
+
+        try:
+            self.ses.send_email(
+                Source=self.config.ses_from_email,
+                Destination={"ToAddresses": self.config.ses_to_emails},
+                Message={
+                    "Subject": {"Data": subject},
+                    "Body": {"Text": {"Data": body}},
+                },
+            )
+            logger.info("Sent SES notification to %s: %s", self.config.ses_to_emails, subject)
+            return True
+        except ClientError as e:
+            logger.error("Failed to send SES notification: %s", e)
+            return False
 
     async def process_changes(
         self,
@@ -232,6 +340,7 @@ Current Status: {self._format_status(current_state)}
         current_state: dict[str, Any],
         changes: dict[str, Any],
         is_new_device: bool,
+        run_ts: Optional[str] = None,
     ) -> None:
         """Process changes and send notifications if needed.
 
@@ -240,29 +349,26 @@ Current Status: {self._format_status(current_state)}
             current_state: Current device state
             changes: Dictionary of changes
             is_new_device: Whether this is a newly discovered device
+            run_ts: Timestamp of the current run (defaults to now)
         """
+        # Parsed once and shared by the low-battery check and the status text
+        voltage = _parse_voltage(current_state.get("battery_voltage"))
+
         # Always notify for new devices
         if is_new_device:
-            message = self.build_message(device_id, current_state, changes, is_new_device)
+            message = self.build_message(
+                device_id, current_state, changes, is_new_device, voltage, run_ts
+            )
             await self.send_notification(message["subject"], message["body"])
             return
 
         # Check if we should notify based on changes
-        should_send = False
-
-        if self.should_notify("status_change", changes, current_state):
-            should_send = True
-        elif self.should_notify("connectivity", changes, current_state):
-            should_send = True
-        elif self.should_notify("maintenance", changes, current_state):
-            should_send = True
-        elif self.should_notify("warning", changes, current_state):
-            should_send = True
-        elif self.should_notify("low_battery", changes, current_state):
-            should_send = True
+        should_send = self.should_notify(changes, voltage)
 
         if should_send:
-            message = self.build_message(device_id, current_state, changes, is_new_device)
+            message = self.build_message(
+                device_id, current_state, changes, is_new_device, voltage, run_ts
+            )
             await self.send_notification(message["subject"], message["body"])
             logger.info("Sent notification for device %s", device_id)
         else:
@@ -1,14 +1,66 @@
 """DynamoDB state manager for tracking generator state changes."""
-import json
+import functools
 import logging
-from datetime import datetime
+import time
 from typing import Any, Optional
 
 import boto3
+import orjson
+from botocore.config import Config as BotoConfig
 from botocore.exceptions import ClientError
 
+from config import DEVICE_TYPE_GENERATOR
+
 logger = logging.getLogger(__name__)
 
+# Maximum number of keys DynamoDB accepts in a single BatchGetItem request
+BATCH_GET_LIMIT = 100
+# Maximum number of items DynamoDB accepts in a single BatchWriteItem request
+BATCH_WRITE_LIMIT = 25
+# Attempts and initial backoff (seconds) for keys left unprocessed by a batch
+BATCH_MAX_ATTEMPTS = 5
+BATCH_RETRY_DELAY = 0.05
+
+
+def _encode_state(state: dict[str, Any]) -> bytes:
+    """Serialize a state dictionary to JSON bytes."""
+    return orjson.dumps(state, default=str)  # Serialize complex objects
+
+
+def _error_code(error: ClientError) -> Optional[str]:
+    """Return the AWS error code of a ClientError, for concise error logs."""
+    return error.response.get("Error", {}).get("Code")
+
+
+def _backoff(attempt: int) -> bool:
+    """Sleep before retrying entries a batch request left unprocessed.
+
+    Args:
+        attempt: Number of attempts made so far
+
+    Returns:
+        False if no attempts are left, True otherwise
+    """
+    if attempt >= BATCH_MAX_ATTEMPTS:
+        return False
+    time.sleep(BATCH_RETRY_DELAY * 2 ** (attempt - 1))
+    return True
+
+
+@functools.lru_cache(maxsize=1)
+def _get_dynamodb():
+    """Return the shared DynamoDB client, created once per Lambda container.
+
+    Short timeouts let a stalled connection be retried instead of holding the
+    invocation for botocore's 60 s defaults.
+    """
+    config = BotoConfig(
+        connect_timeout=1,
+        read_timeout=3,
+        retries={"max_attempts": 3, "mode": "adaptive"},
+    )
+    return boto3.client("dynamodb", config=config)
+
 
 class StateManager:
     """Manages generator state persistence in DynamoDB."""
@@ -20,8 +72,7 @@ class StateManager:
             table_name: Name of the DynamoDB table
         """
         self.table_name = table_name
-        self.dynamodb = boto3.resource("dynamodb")
-        self.table = self.dynamodb.Table(table_name)
+        self.client = _get_dynamodb()
 
     def get_previous_state(self, device_id: str) -> Optional[dict[str, Any]]:
         """Get the previous state for a device.
@@ -30,21 +81,71 @@ class StateManager:
             device_id: The device ID
 
         Returns:
-            Previous state dictionary or None if not found
+            Previous state dictionary or None if not found. Its "state"
+            entry is always a parsed dictionary.
         """
         try:
-            response = self.table.get_item(Key={"device_id": device_id})
+            response = self.client.get_item(
+                TableName=self.table_name, Key={"device_id": {"S": device_id}}
+            )
             if "Item" in response:
-                item = response["Item"]
-                # Parse the state JSON if it's stored as a string
-                if "state" in item and isinstance(item["state"], str):
-                    item["state"] = json.loads(item["state"])
-                return item
+                return self._parse_item(response["Item"])
             return None
         except ClientError as e:
-            logger.error("Error getting previous state for %s: %s", device_id, e)
+            logger.error("Error getting previous state for %s: %s", device_id, _error_code(e))
             return None
 
+    def batch_get_previous_states(self, device_ids: list[str]) -> dict[str, dict[str, Any]]:
+        """Get the previous states for several devices in batched requests.
+
+        Args:
+            device_ids: The device IDs
+
+        Returns:
+            Dictionary mapping device IDs to previous state dictionaries,
+            whose "state" entries are parsed dictionaries. Devices without a
+            stored state are omitted.
+        """
+        states: dict[str, dict[str, Any]] = {}
+        for start in range(0, len(device_ids), BATCH_GET_LIMIT):
+            chunk = device_ids[start:start + BATCH_GET_LIMIT]
+            request = {
+                self.table_name: {
+                    "Keys": [{"device_id": {"S": device_id}} for device_id in chunk]
+                }
+            }
+            attempt = 0
+            while request:
+                if attempt and not _backoff(attempt):
+                    logger.error("Giving up on unprocessed keys for %s", chunk)
+                    break
+                attempt += 1
+
+                try:
+                    response = self.client.batch_get_item(RequestItems=request)
+                except ClientError as e:
+                    logger.error("Error getting previous states for %s: %s", chunk, _error_code(e))
+                    break
+
+                for item in response.get("Responses", {}).get(self.table_name, []):
+                    item = self._parse_item(item)
+                    states[item["device_id"]] = item
+                request = response.get("UnprocessedKeys")
+        return states
+
+    @staticmethod
+    def _parse_item(item: dict[str, Any]) -> dict[str, Any]:
+        """Unpack a stored item from DynamoDB attribute values.
+
+        States are stored as binary JSON, or as a JSON string by older versions.
+        """
+        state = item.get("state", {})
+        payload = state.get("B", state.get("S"))
+        return {
+            "device_id": item["device_id"]["S"],
+            "state": orjson.loads(payload) if payload else {},
+        }
+
     def save_state(self, device_id: str, state: dict[str, Any]) -> bool:
         """Save the current state for a device.
 
@@ -56,16 +157,50 @@ class StateManager:
             True if successful, False otherwise
         """
         try:
-            item = {
-                "device_id": device_id,
-                "state": json.dumps(state, default=str),  # Serialize complex objects
-                "last_updated": datetime.utcnow().isoformat(),
-            }
-            self.table.put_item(Item=item)
+            item = self._build_item(device_id, state)
+            self.client.put_item(TableName=self.table_name, Item=item)
             return True
         except ClientError as e:
-            logger.error("Error saving state for %s: %s", device_id, e)
+            logger.error("Error saving state for %s: %s", device_id, _error_code(e))
+            return False
+
+    def save_states(self, states: dict[str, dict[str, Any]]) -> bool:
+        """Save the current states for several devices in batched requests.
+
+        Args:
+            states: Dictionary mapping device IDs to current state dictionaries
+
+        Returns:
+            True if successful, False otherwise
+        """
+        requests = [
+            {"PutRequest": {"Item": self._build_item(device_id, state)}}
+            for device_id, state in states.items()
+        ]
+        try:
+            for start in range(0, len(requests), BATCH_WRITE_LIMIT):
+                request = {self.table_name: requests[start:start + BATCH_WRITE_LIMIT]}
+                attempt = 0
+                while request:
+                    if attempt and not _backoff(attempt):
+                        logger.error("Giving up on unprocessed writes for %s", list(states))
+                        return False
+                    attempt += 1
+                    response = self.client.batch_write_item(RequestItems=request)
+                    request = response.get("UnprocessedItems")
+        except ClientError as e:
+            logger.error("Error saving states for %s: %s", list(states), _error_code(e))
             return False
+        return True
+
+    @staticmethod
+    def _build_item(device_id: str, state: dict[str, Any]) -> dict[str, Any]:
+        """Build the DynamoDB item, as attribute values, stored for a device state."""
+        return {
+            "device_id": {"S": device_id},
+            "state": {"B": _encode_state(state)},
+            "last_updated": {"N": str(int(time.time() * 1000))},  # Epoch milliseconds
+        }
 
     def extract_state(self, item: Any) -> dict[str, Any]:
         """Extract relevant state from an Item object.
@@ -76,46 +211,45 @@ class StateManager:
         Returns:
             Dictionary with relevant state information
         """
-        from models import Item
-        from config import DEVICE_TYPE_GENERATOR
-
-        if not isinstance(item, Item):
+        try:
+            ap = item.apparatus
+            ad = item.apparatusDetail
+            state = {
+                "device_type": ap.type,
+                "name": ap.name,
+                "serial_number": ap.serialNumber,
+                "is_connected": ad.isConnected,
+                "is_connecting": ad.isConnecting,
+                "has_maintenance_alert": ad.hasMaintenanceAlert,
+                "show_warning": ad.showWarning,
+                "status_label": ad.statusLabel,
+                "status_text": ad.statusText,
+                "apparatus_status": ad.apparatusStatus,
+                "last_seen": ad.lastSeen,
+                "battery_voltage": None,
+            }
+        except AttributeError:
             return {}
 
-        state = {
-            "device_type": item.apparatus.type,
-            "name": item.apparatus.name,
-            "serial_number": item.apparatus.serialNumber,
-            "is_connected": item.apparatusDetail.isConnected,
-            "is_connecting": item.apparatusDetail.isConnecting,
-            "has_maintenance_alert": item.apparatusDetail.hasMaintenanceAlert,
-            "show_warning": item.apparatusDetail.showWarning,
-            "status_label": item.apparatusDetail.statusLabel,
-            "status_text": item.apparatusDetail.statusText,
-            "apparatus_status": item.apparatusDetail.apparatusStatus,
-            "last_seen": item.apparatusDetail.lastSeen,
-        }
-
         # Add generator-specific fields
-        if item.apparatus.type == DEVICE_TYPE_GENERATOR:
+        if ap.type == DEVICE_TYPE_GENERATOR:
             # Extract battery voltage (property type 70)
-            battery_voltage = None
-            if item.apparatusDetail.properties:
-                for prop in item.apparatusDetail.properties:
-                    if prop.type == 70:
-                        battery_voltage = prop.value
-                        break
-            state["battery_voltage"] = battery_voltage
+            battery = ad.properties_by_type.get(70)
+            if battery is not None:
+                state["battery_voltage"] = battery.value
 
         return state
 
     def compare_states(
-        self, previous: Optional[dict[str, Any]], current: dict[str, Any]
+        self,
+        previous: Optional[dict[str, Any]],
+        current: dict[str, Any],
     ) -> dict[str, Any]:
         """Compare two states and identify changes.
 
         Args:
-            previous: Previous state dictionary
+            previous: Previous state dictionary, as returned by
+                get_previous_state or batch_get_previous_states
             current: Current state dictionary
 
         Returns:
@@ -127,17 +261,11 @@ class StateManager:
                 "changes": {},
             }
 
-        # Parse state if it's stored as JSON string
-        if isinstance(previous.get("state"), str):
-            previous_state = json.loads(previous["state"])
-        else:
-            previous_state = previous.get("state", {})
+        previous_state = previous.get("state") or {}
 
         changes = {}
-        for key in current:
+        for key, curr_value in current.items():
             prev_value = previous_state.get(key)
-            curr_value = current[key]
-
             if prev_value != curr_value:
                 changes[key] = {
                     "previous": prev_value,